@@ -10,7 +10,7 @@ Class to represent a schedule day. 0 = Monday, 5 = Saturday.
 - dayNum 
 - isOpen
 - closedReason
-- clockIns (all below are same, 1x5 array for DVMs)
+- clockIns (all below are same, 1x5 array for DVMs, 0 = unset)
 - clockOuts
 - lunches
 - aptTypes 
@@ -22,7 +22,26 @@ LO // LP // EJS // JA // EDS
 '''
 from lib.DVM import DVM
 
+def _offMask(*dvms):
+    mask = bytearray(DVM.NUM_DVMS)
+    for dvm in dvms:
+        mask[dvm] = True
+    return bytes(mask)
+
 class Day:
+    __slots__ = ('dayNum', 'isOpen', 'closedReason', 'clockIns', 'clockOuts',
+                 'lunches', 'aptTypes', 'vacationOff', 'standardOff', '_hoursCache')
+
+    # STANDARD OFFS PER DAY OF WEEK, BUILT ONCE AND COPIED INTO standardOff ON INIT
+    _STD_OFF = (
+        _offMask(DVM.LP, DVM.EJS), # MONDAY OFFS (LP, EJS)
+        _offMask(DVM.JA), # TUESDAY OFFS (JA)
+        _offMask(DVM.LO, DVM.EDS), # WEDNESDAY OFFS (LO, EDS)
+        _offMask(), # NO AUTOMATIC OFFS FOR THURSDAY
+        _offMask(DVM.LO), # FRIDAY OFFS (LO)
+        _offMask(), # NO AUTOMATIC OFFS FOR SATURDAY
+    )
+    _LUNCH_LEN = (2, 2, 1, 1, 1, 1) # LUNCH HOURS PER DAY OF WEEK
 
     def __init__(self, dayNum, isOpen=True, closedReason=None):
         if dayNum < 0 or dayNum > 5:
@@ -34,33 +53,75 @@ class Day:
             self.closedReason = closedReason
             return
 
-        self.clockIns = [None, None, None, None, None] # INT FOR HOUR IN
-        self.clockOuts = [None, None, None, None, None] # INT FOR HOUR OUT
-        self.lunches = [None, None, None, None, None] # INT FOR HOUR START
-
-        self.aptTypes = [None, None, None, None, None]
-
-        self.vacationOff = [False, False, False, False, False] # T/F FOR VACATION OFF
-
-        if (dayNum == 0): # MONDAY OFFS (LP, EJS)
-            self.standardOff = [False, True, True, False, False]
-        elif (dayNum == 1): # TUESDAY OFFS (JA)
-            self.standardOff = [False, False, False, True, False]
-        if (dayNum == 2): # WEDNESDAY OFFS (LO, EDS)    
-            self.standardOff = [True, False, False, False, True]
-        elif (dayNum == 4): # FRIDAY OFFS  (LO)
-            self.standardOff = [True, False, False, False, False]
-        else: # NO AUTOMATIC OFFS FOR THURSDAY, SATURDAY
-            self.standardOff = [False, False, False, False, False]
-
-    def setVet(self, dvm: DVM, clockIn, clockOut, aptType, lunch=None):
-        dvmIdx = dvm.value
-        self.clockIns[dvmIdx] = clockIn
-        self.clockOuts[dvmIdx] = clockOut
-        self.aptTypes[dvmIdx] = aptType
-        self.lunches[dvmIdx] = lunch
-
-    def setVacation(self, dvm: DVM):
-        self.vacationOff[dvm.value] = True
-    
-    # TODO: IMPLEMENT GET HOURS FUNCTION
\ No newline at end of file
+        # BYTEARRAYS (0 = UNSET) KEEP EACH FIELD IN ONE CONTIGUOUS BUFFER
+        self.clockIns = bytearray(DVM.NUM_DVMS) # INT FOR HOUR IN
+        self.clockOuts = bytearray(DVM.NUM_DVMS) # INT FOR HOUR OUT
+        self.lunches = bytearray(DVM.NUM_DVMS) # INT FOR HOUR START
+
+        self.aptTypes = [None] * DVM.NUM_DVMS
+
+        self.vacationOff = bytearray(DVM.NUM_DVMS) # T/F FOR VACATION OFF
+
+        self.standardOff = bytearray(Day._STD_OFF[dayNum])
+
+        self._hoursCache = [None] * DVM.NUM_DVMS # HOURS WORKED, RESET BY setVet
+
+    def setVet(self, dvm: int, clockIn, clockOut, aptType, lunch=None):
+        self.clockIns[dvm] = clockIn or 0
+        self.clockOuts[dvm] = clockOut or 0
+        self.aptTypes[dvm] = aptType
+        self.lunches[dvm] = lunch or 0
+        self._hoursCache[dvm] = None
+
+    def setVacation(self, dvm: int):
+        self.vacationOff[dvm] = True
+
+    # Hours on the clock, last hour inclusive, minus lunch (2 hrs Mon/Tue, else 1)
+    def getHoursWorked(self, dvm: int):
+        hours = self._hoursCache[dvm]
+        if hours is not None:
+            return hours
+
+        clockIn = self.clockIns[dvm]
+        if not clockIn:
+            hours = 0
+        else:
+            hours = self.clockOuts[dvm] - clockIn + 1
+            if self.lunches[dvm]:
+                hours -= Day._LUNCH_LEN[self.dayNum]
+
+        self._hoursCache[dvm] = hours
+        return hours
+
+    def isWorking(self, dvm: int):
+        return self.clockIns[dvm] > 0
+
+    # (clockIn, clockOut) from a single clock-in read, or None if not working
+    def getClockHours(self, dvm: int):
+        clockIn = self.clockIns[dvm]
+        return (clockIn, self.clockOuts[dvm]) if clockIn else None
+
+    def getLunchHours(self, dvm: int):
+        lunchStart = self.lunches[dvm]
+        if not lunchStart:
+            return None
+        return lunchStart, lunchStart + Day._LUNCH_LEN[self.dayNum]
+
+    def __str__(self):
+        if not self.isOpen:
+            return f"CLOSED: {self.closedReason}\n"
+
+        parts = []
+        for dvm, name in enumerate(DVM.NAMES):
+            clockHours = self.getClockHours(dvm)
+            if clockHours is None:
+                parts.append(f"{name}: OFF")
+                continue
+
+            line = f"{name}: {self.getHoursWorked(dvm)} hours //// {clockHours[0]}-{clockHours[1]}"
+            lunch = self.getLunchHours(dvm)
+            if lunch is not None:
+                line += f" //// LUNCH {lunch[0]}-{lunch[1]}"
+            parts.append(line)
+
+        return "\n".join(parts) + "\n"
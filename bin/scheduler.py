@@ -9,9 +9,12 @@ Using Calendar module, days are zero-based indexed, months are one-based indexed
 - closedDict: DICT where key = day closed, value = reason
 - vacationArray: LIST where each idx corresponds to DVM containing a list of their days off
                  [[1, 28], [], [], [3 4 5], []]
+                 days must be dates in the month (else ValueError); days that fall on a
+                 Sunday or a closed day are ignored
 - prevDays: LIST of DAY objects for days in previous month (ACTUAL DAY OBJECTS)
 - satSurgeon: which is the sat Surgeon of the month
 - satSurgeonDayOff: boolean which saturday the monthly sat surgeon requested off
+- includeTrailingPad: build post-month days to complete the last week (default False)
 
 @DATAFIELDS
 - ALL PARAMS PLUS:
@@ -20,67 +23,90 @@ Using Calendar module, days are zero-based indexed, months are one-based indexed
 - lastDayOfMonth: which type of day for EOM (0-6)
 - monthStartOffset: how many days prior to month start (IDX ADD)
 - monthEndOffset: how many days after month end (IDX ADD)
-- schedule: array representation of the schedule. contains pre-month and post-month days for full weeks
+- schedule: array representation of the schedule. contains pre-month days, and post-month days
+            for a full last week only if includeTrailingPad
 '''
 
 import calendar
+from functools import lru_cache
 from day import Day
-from typing import List
+from lib.DVM import DVM
+from typing import List, Optional
+
+@lru_cache(maxsize=64)
+def _monthLayout(year, month):
+    _, numDays = calendar.monthrange(year, month)
+
+    firstDayOfMonth = calendar.weekday(year, month, 1)
+    monthStartOffset = firstDayOfMonth % 6 # when current month starts in array
+
+    # Weekdays advance by one per day, so derive them all from the first
+    weekdays = tuple((firstDayOfMonth + i) % 7 for i in range(numDays))
+
+    lastDayOfMonth = weekdays[-1]
+    if (lastDayOfMonth == 6):
+        monthEndOffset = 0 # how many extra days in array to complete a week
+    else:
+        monthEndOffset = 5 - lastDayOfMonth
+
+    return (numDays, firstDayOfMonth, lastDayOfMonth, weekdays,
+            monthStartOffset, monthEndOffset)
 
 class Scheduler:
-    NUM_DVMs = 5
+    __slots__ = ('month', 'year', 'numDays', 'firstDayOfMonth', 'lastDayOfMonth',
+                 'monthStartOffset', 'monthEndOffset', 'schedule')
 
     def __init__(self, month, year, closedDict, vacationArray, satSurgeon,
-                 prevDays=None, satSurgeonDayOff=None):
+                 prevDays=None, satSurgeonDayOff=None, includeTrailingPad=False):
         
         self.month = month
         self.year = year
 
-        _, self.numDays = calendar.monthrange(year, month)
-
-        self.firstDayOfMonth = calendar.weekday(year, month, 1) # OUTPUTTING ACTUAL DAY OBJECT NOT INT
-        self.monthStartOffset = self.firstDayOfMonth % 6 # when current month starts in array
-
         # TODO: VACATION DAY INPUT/CALCULATORS FOR THIS
-        self.lastDayOfMonth = calendar.weekday(year, month, self.firstDayOfMonth)
-        if (self.lastDayOfMonth == 6):
-            self.monthEndOffset = 0 # how many extra days in array to complete a week
-        else:
-            self.monthEndOffset = 5 - self.lastDayOfMonth
+        (self.numDays, self.firstDayOfMonth, self.lastDayOfMonth, weekdays,
+         self.monthStartOffset, self.monthEndOffset) = _monthLayout(year, month)
 
-        self.schedule: List[Day] = [] # list of Mon-Sat Days. % 6 = 0 is Mondays, % 6 = 5 is Saturday
+        # Final length is known up front, so size the list once and fill by index
+        numSundays = weekdays.count(6)
+        padLen = self.monthEndOffset if includeTrailingPad else 0
+        scheduleLen = self.monthStartOffset + self.numDays - numSundays + padLen
+        schedule: List[Optional[Day]] = [None] * scheduleLen
 
         # Instantiates prior-to-month-days in array (for a full week)
         if (self.monthStartOffset != 0):
             if (prevDays is None or len(prevDays) != self.monthStartOffset):
                 raise ValueError("Error: Invalid Amount of Prior Days for Month")
-            for day in prevDays:
-                self.schedule.append(day)
+            schedule[:self.monthStartOffset] = prevDays
+        k = self.monthStartOffset # next index to fill
         
-        # Instantiates days actually in month in array
-        for i in range(1, self.numDays + 1):
-            dayOfWeek = calendar.weekday(year, month, i)
-            if (dayOfWeek == 6): pass
-            
-            if i in closedDict:
-                self.schedule.append(Day(dayOfWeek, False, closedDict[i]))
-            else:
-                self.schedule.append(Day(i))
-
-        # Instantiates post-month-days in array (for a full week)
-        for i in range (1, self.monthEndOffset + 1):
-            tempYear = year
-            tempMonth = month
-            if month == 12: 
-                tempYear = year +1
-                tempMonth = 1
-
-            dayOfWeek = calendar.weekday(tempYear, tempMonth, i)
-            self.schedule.append(Day(i))
-
-        # Implementing declared vacation days. i is DVM_IDX
-        for i in range(Scheduler.NUM_DVMs):
-            for j in vacationArray[i]:
-                self.schedule[j + self.monthStartOffset].setVacation(i)
+        # Instantiates days actually in month in array, skipping Sundays.
+        # dayIdx maps each date to its schedule index (None for Sundays)
+        dayIdx = [None] * (self.numDays + 1)
+        for i, dayOfWeek in enumerate(weekdays, start=1):
+            if (dayOfWeek == 6): continue
+
+            dayIdx[i] = k
+            closedReason = closedDict.get(i) # None when the clinic is open
+            schedule[k] = Day(dayOfWeek, closedReason is None, closedReason)
+            k += 1
+
+        # Instantiates post-month-days in array (for a full week). Never scheduled,
+        # so only built when the caller asks for them
+        for i in range (1, padLen + 1):
+            dayOfWeek = (self.lastDayOfMonth + i) % 7
+            schedule[k] = Day(dayOfWeek)
+            k += 1
+
+        self.schedule: List[Day] = schedule # list of Mon-Sat Days. % 6 = 0 is Mondays, % 6 = 5 is Saturday
+
+        # Implementing declared vacation days, one DVM's list at a time
+        for dvm, daysOff in enumerate(vacationArray):
+            for j in daysOff:
+                if (j < 1 or j > self.numDays):
+                    raise ValueError(f"Error: Invalid Vacation Day for {DVM.NAMES[dvm]} (got {j})")
+                idx = dayIdx[j]
+                # no schedule entry for Sundays, and closed days have no vacation buffer
+                if idx is not None and schedule[idx].isOpen:
+                    schedule[idx].setVacation(dvm)
         
         #TODO: Implement fixed Days, Sat Surgeon Days, Sat Surgeon Days Off 
\ No newline at end of file
@@ -1,8 +1,10 @@
-from enum import Enum
-
-class DVM(Enum):
+class DVM:
     LO = 0
     LP = 1
     EJS = 2
     JA = 3
-    EDS = 4
\ No newline at end of file
+    EDS = 4
+
+    NUM_DVMS = 5
+    ALL = (LO, LP, EJS, JA, EDS)
+    NAMES = ('LO', 'LP', 'EJS', 'JA', 'EDS')